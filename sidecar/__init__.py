@@ -11,11 +11,26 @@ A vault-specific Python sidecar process providing:
 __version__ = "0.1.0"
 __author__ = "AGS Lab"
 
-# Public API exports
-from .websocket_server import WebSocketServer
-from .vault_brain import VaultBrain
+import importlib
+from typing import Any
+
+# Public API exports, imported on first access (PEP 562) so that
+# `from sidecar import utils` does not pull in the LLM stack
+_LAZY_EXPORTS = {
+    "WebSocketServer": ".websocket_server",
+    "VaultBrain": ".vault_brain",
+}
 
 __all__ = [
     "WebSocketServer",
     "VaultBrain",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
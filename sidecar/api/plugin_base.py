@@ -5,9 +5,18 @@ Abstract base class that all plugins should inherit from.
 Provides standardized lifecycle hooks and command registration.
 """
 
+import os
+import re
+import stat
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Any, Optional, TYPE_CHECKING, cast, Callable, Awaitable
+from typing import Dict, Any, FrozenSet, Optional, Tuple, TYPE_CHECKING, cast, Callable, Awaitable
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Handle imports for both package context (tests) and standalone context (plugins)
 from sidecar import utils
@@ -16,6 +25,9 @@ from sidecar import constants
 if TYPE_CHECKING:
     from sidecar.vault_brain import VaultBrain
 
+# Digit runs too long for a 64-bit int; orjson would read those as floats
+_WIDE_INT_RE = re.compile(rb"\d{20,}")
+
 
 class PluginBase(ABC):
     """
@@ -36,6 +48,16 @@ class PluginBase(ABC):
         5. on_unload() - Called on shutdown
     """
     
+    # No-op hooks this class replaces; the Brain skips calling the others
+    _overridden_hooks: FrozenSet[str] = frozenset()
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._overridden_hooks = frozenset(
+            hook for hook in ("on_tick", "on_client_connected")
+            if getattr(cls, hook) is not getattr(PluginBase, hook)
+        )
+    
     def __init__(
         self,
         plugin_dir: Path,
@@ -62,6 +84,9 @@ class PluginBase(ABC):
         # Plugin state
         self._loaded = False
         
+        # Raw settings bytes keyed by filename, tagged with (mtime_ns, size)
+        self._settings_cache: Dict[str, Tuple[int, int, bytes]] = {}
+        
         self.logger.debug(f"Plugin '{self.name}' initialized (Passive)")
 
     @property
@@ -152,14 +177,34 @@ class PluginBase(ABC):
         return self.plugin_dir / filename
     
     def load_settings(self, filename: str = constants.PLUGIN_SETTINGS_FILE) -> Dict[str, Any]:
-        """Load plugin settings from JSON file."""
+        """
+        Load plugin settings from JSON file.
+        
+        The file's bytes are cached until its mtime or size changes; the
+        result is parsed on every call so callers get their own dict.
+        """
         import json
         settings_file = self.get_config_path(filename)
-        if not settings_file.exists():
+        try:
+            st = os.stat(settings_file)
+        except FileNotFoundError:
             return {}
         try:
-            with open(settings_file, 'r', encoding='utf-8') as f:
-                return cast(Dict[str, Any], json.load(f))
+            cached = self._settings_cache.get(filename)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                raw = cached[2]
+            else:
+                raw = settings_file.read_bytes()
+                self._settings_cache[filename] = (st.st_mtime_ns, st.st_size, raw)
+            if ORJSON_AVAILABLE and not _WIDE_INT_RE.search(raw):
+                try:
+                    data = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # NaN/Infinity literals, which only the stdlib accepts
+                    data = json.loads(raw)
+            else:
+                data = json.loads(raw)
+            return cast(Dict[str, Any], data)
         except Exception as e:
             self.logger.error(f"Failed to load settings: {e}")
             return {}
@@ -167,16 +212,56 @@ class PluginBase(ABC):
     def save_settings(
         self,
         settings: Dict[str, Any],
-        filename: str = constants.PLUGIN_SETTINGS_FILE
+        filename: str = constants.PLUGIN_SETTINGS_FILE,
+        durable: bool = False
     ) -> bool:
-        """Save plugin settings to JSON file."""
+        """
+        Save plugin settings to JSON file.
+        
+        The file is written to a temporary sibling and swapped in with
+        os.replace, so readers never see a partial file. Pass durable=True
+        to fsync before the swap.
+        """
         import json
         settings_file = self.get_config_path(filename)
+        tmp_file = settings_file.with_name(settings_file.name + ".tmp")
         try:
-            with open(settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2)
-                return True
+            payload = None
+            if ORJSON_AVAILABLE and not utils.has_non_finite(settings):
+                try:
+                    payload = orjson.dumps(
+                        settings, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    )
+                except TypeError:
+                    # e.g. ints beyond 64 bits, which the stdlib encoder still handles
+                    pass
+            if payload is None:
+                payload = json.dumps(settings, indent=2).encode('utf-8')
+            
+            # Keep the permissions of an existing file (e.g. a user's chmod 600)
+            try:
+                mode: Optional[int] = stat.S_IMODE(os.stat(settings_file).st_mode)
+            except FileNotFoundError:
+                mode = None
+            
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                if durable:
+                    os.fsync(fd)
+                st = os.fstat(fd)
+            finally:
+                os.close(fd)
+            if mode is not None:
+                os.chmod(tmp_file, mode)
+            os.replace(tmp_file, settings_file)
+            self._settings_cache[filename] = (st.st_mtime_ns, st.st_size, payload)
+            return True
         except Exception as e:
+            self._settings_cache.pop(filename, None)
+            tmp_file.unlink(missing_ok=True)
             self.logger.error(f"Failed to save settings: {e}")
             return False
         
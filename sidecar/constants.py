@@ -173,6 +173,12 @@ MIN_WEBSOCKET_PORT: Final[int] = 9000
 MAX_WEBSOCKET_PORT: Final[int] = 9999
 """Maximum WebSocket port number."""
 
+WEBSOCKET_MAX_BATCH: Final[int] = 32
+"""Maximum queued messages coalesced into one outgoing batch frame."""
+
+WEBSOCKET_MAX_PENDING: Final[int] = 1024
+"""Maximum messages buffered before the event loop starts (oldest dropped first)."""
+
 
 # ============================================================================
 # Path Constants
@@ -217,6 +223,9 @@ UI_COMMAND_PREFIX: Final[str] = "ui."
 CHAT_COMMAND_PREFIX: Final[str] = "chat."
 """Prefix for chat-related commands."""
 
+MAX_LISTED_COMMANDS: Final[int] = 10
+"""Maximum available command ids reported in a CommandNotFoundError."""
+
 
 # ============================================================================
 # Logging Constants
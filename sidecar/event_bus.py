@@ -18,6 +18,8 @@ class EventBus:
     """
     def __init__(self):
         self._subscribers: Dict[str, List[Tuple[int, EventHandler]]] = defaultdict(list)
+        # Priority-ordered handlers per event, rebuilt after any (un)subscribe
+        self._handler_cache: Dict[str, Tuple[EventHandler, ...]] = {}
         self.logger = logger.bind(component="EventBus")
 
     def subscribe(self, event: str, handler: EventHandler, priority: int = 0) -> None:
@@ -36,6 +38,7 @@ class EventBus:
         # We sort descending so higher priority is first
         self._subscribers[event].append((priority, handler))
         self._subscribers[event].sort(key=lambda x: x[0], reverse=True)
+        self._handler_cache.pop(event, None)
         
         self.logger.debug(f"Subscribed to: {event} (priority={priority})")
 
@@ -49,6 +52,7 @@ class EventBus:
             for i, (p, h) in enumerate(handlers_list):
                 if h == handler:
                     handlers_list.pop(i)
+                    self._handler_cache.pop(event, None)
                     self.logger.debug(f"Unsubscribed from: {event}")
                     return True
         return False
@@ -57,6 +61,7 @@ class EventBus:
         """Clear all subscribers for an event."""
         if event in self._subscribers:
             self._subscribers[event].clear()
+            self._handler_cache.pop(event, None)
             self.logger.debug(f"Cleared subscribers for: {event}")
 
     async def publish(self, event: str, sequential: bool = False, **kwargs: Any) -> None:
@@ -69,22 +74,23 @@ class EventBus:
                        If False, run all handlers in parallel.
             **kwargs: Arguments to pass to handlers
         """
-        priority_handlers = self._subscribers.get(event, [])
-        # print(f"DEBUG: EventBus publishing {event}, found {len(priority_handlers)} subscribers")
-        if not priority_handlers:
-            return
-            
-        # Extract just the handlers in order
-        handlers = [h for _, h in priority_handlers]
-                    
-        async def safe_exec(h: EventHandler) -> None:
-            try:
-                await h(**kwargs)
-            except Exception as e:
-                self.logger.exception(f"Event handler failed for '{event}': {e}")
+        handlers = self._handler_cache.get(event)
+        if handlers is None:
+            # Extract just the handlers in order
+            handlers = tuple(h for _, h in self._subscribers.get(event, ()))
+            if not handlers:
+                return
+            self._handler_cache[event] = handlers
 
         if sequential:
             for h in handlers:
-                await safe_exec(h)
+                await self._safe_exec(event, h, kwargs)
         else:
-            await asyncio.gather(*(safe_exec(h) for h in handlers))
+            await asyncio.gather(*(self._safe_exec(event, h, kwargs) for h in handlers))
+
+    async def _safe_exec(self, event: str, handler: EventHandler, kwargs: Dict[str, Any]) -> None:
+        """Run one handler, logging instead of propagating its failure."""
+        try:
+            await handler(**kwargs)
+        except Exception as e:
+            self.logger.exception(f"Event handler failed for '{event}': {e}")
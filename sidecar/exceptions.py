@@ -210,7 +210,7 @@ class CommandNotFoundError(CommandError):
     def __init__(self, command_id: str, available_commands: Optional[list] = None):
         details: Dict[str, Any] = {"command_id": command_id}
         if available_commands:
-            details["available_commands"] = available_commands[:10]  # Limit to first 10
+            details["available_commands"] = available_commands[:constants.MAX_LISTED_COMMANDS]
         
         super().__init__(
             f"Command '{command_id}' not found",
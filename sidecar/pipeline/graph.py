@@ -14,6 +14,9 @@ class GraphPipeline:
         self.config = config
         self._logger = logger.bind(component="GraphPipeline")
         
+        # Linear fallback, compiled on first use and reused afterwards
+        self._fallback: Optional[DefaultPipeline] = None
+        
         # In the future, this would load the graph definition
         # self.graph = load_graph(config.graph_config)
 
@@ -30,5 +33,6 @@ class GraphPipeline:
         # so things don't break if someone accidentally toggles this mode.
         self._logger.warning("Graph execution not fully implemented. Falling back to linear flow.")
         
-        fallback = DefaultPipeline(self.config)
-        return await fallback.run(message, history)
+        if self._fallback is None:
+            self._fallback = DefaultPipeline(self.config)
+        return await self._fallback.run(message, history)
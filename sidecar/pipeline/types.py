@@ -1,3 +1,4 @@
+from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field, ConfigDict
 import datetime
@@ -21,20 +22,23 @@ class PipelineConfig(BaseModel):
     is_graph_mode: bool = False
     graph_config: Optional[Dict[str, Any]] = None
 
-class PipelineContext(BaseModel):
+@dataclass(slots=True)
+class PipelineContext:
     """
     Context passed through the pipeline.
     Represents the State of the LangGraph.
+    
+    A plain slotted dataclass: it is built on every run and every graph
+    step, so it skips Pydantic validation.
     """
-    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     # Input
     message: str
     original_message: str
     
     # State (Mutable by plugins)
-    history: List[Dict[str, Any]] = Field(default_factory=list)
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    history: List[Dict[str, Any]] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
     
     # Output
     response: Optional[str] = None
@@ -44,8 +48,20 @@ class PipelineContext(BaseModel):
     abort_reason: Optional[str] = None
     
     # Telemetry
-    events_emitted: List[str] = Field(default_factory=list)
-    start_time: float = Field(default_factory=lambda: datetime.datetime.now().timestamp())
+    events_emitted: List[str] = field(default_factory=list)
+    start_time: float = field(default_factory=lambda: datetime.datetime.now().timestamp())
+    
+    def model_dump(self) -> Dict[str, Any]:
+        """Return the fields as a dict for LangGraph state updates.
+        
+        The containers are copied so later plugin mutations don't leak into
+        state LangGraph already holds.
+        """
+        data = {name: getattr(self, name) for name in self.__dataclass_fields__}
+        data["history"] = list(self.history)
+        data["metadata"] = dict(self.metadata)
+        data["events_emitted"] = list(self.events_emitted)
+        return data
     
     def add_metadata(self, key: str, value: Any) -> None:
         self.metadata[key] = value
@@ -10,6 +10,7 @@ Provides functionality for:
 """
 
 import json
+import re
 import shutil
 import asyncio
 import tempfile
@@ -22,6 +23,11 @@ from enum import Enum
 import httpx
 from loguru import logger
 
+from . import utils
+
+
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+(-[\w.]+)?(\+[\w.]+)?$")
+
 
 class InstallStatus(Enum):
     """Plugin installation status."""
@@ -160,6 +166,7 @@ class PluginInstaller:
                 settings["enabled"] = True
                 settings_file.write_text(json.dumps(settings, indent=2))
             
+            utils.clear_discover_cache()
             self._logger.info(f"Plugin '{plugin_id}' installed successfully")
             
             return InstallResult(
@@ -303,6 +310,7 @@ class PluginInstaller:
             if not settings_file.exists():
                 settings_file.write_text(json.dumps({"enabled": True}, indent=2))
             
+            utils.clear_discover_cache()
             self._logger.info(f"Plugin '{plugin_id}' installed successfully from URL")
             
             return InstallResult(
@@ -369,6 +377,8 @@ class PluginInstaller:
                     message=f"Git pull failed: {error_msg}"
                 )
             
+            utils.clear_discover_cache()
+
             # Re-validate after update
             validation = await self.validate(plugin_dir)
             
@@ -414,6 +424,7 @@ class PluginInstaller:
         try:
             # Use to_thread for blocking file IO
             await asyncio.to_thread(shutil.rmtree, plugin_dir)
+            utils.clear_discover_cache()
             self._logger.info(f"Plugin '{plugin_id}' uninstalled")
             return True
         except Exception as e:
@@ -586,6 +597,4 @@ class PluginInstaller:
     
     def _is_valid_semver(self, version: str) -> bool:
         """Check if version string is valid semver."""
-        import re
-        pattern = r"^\d+\.\d+\.\d+(-[\w.]+)?(\+[\w.]+)?$"
-        return bool(re.match(pattern, version))
+        return _SEMVER_RE.match(version) is not None
@@ -4,9 +4,14 @@ Pytest configuration for Tailor sidecar tests.
 This module configures pytest for testing the refactored codebase.
 """
 
+import os
+import shutil
 import sys
 from pathlib import Path
 
+import pytest
+from pytest_asyncio import is_async_test
+
 # Add tailor root to path for imports (allow 'sidecar' package import)
 tailor_path = Path(__file__).resolve().parent.parent.parent
 if str(tailor_path) not in sys.path:
@@ -15,7 +20,7 @@ if str(tailor_path) not in sys.path:
 
 # Pytest configuration
 def pytest_configure(config):
-    """Configure pytest with custom markers."""
+    """Configure pytest with custom markers and a tmpfs basetemp."""
     config.addinivalue_line(
         "markers", "unit: mark test as a unit test"
     )
@@ -25,3 +30,59 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: mark test as slow running"
     )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): keep tests on one pytest-xdist worker"
+    )
+
+    # Keep tmp_path on a RAM-backed filesystem when one is available. Only the
+    # temp root moves: pytest still owns pytest-of-<user>/pytest-N beneath it,
+    # so concurrent runs don't share (or delete) each other's directories.
+    shm = Path("/dev/shm")
+    if config.option.basetemp is None and shm.is_dir() and os.access(shm, os.W_OK):
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", str(shm))
+
+
+@pytest.fixture
+def fresh_vault_brain():
+    """Clear the VaultBrain singleton before and after a test."""
+    from sidecar.vault_brain import VaultBrain
+    VaultBrain._instance = None
+    yield VaultBrain
+    VaultBrain._instance = None
+
+
+@pytest.fixture(scope="session")
+def vault_template(tmp_path_factory):
+    """Build a minimal vault once per session. Read-only: do not write to it."""
+    vault_path = tmp_path_factory.mktemp("templates") / "test_vault"
+    vault_path.mkdir()
+    (vault_path / ".vault.json").write_bytes(b"{}")
+    return vault_path
+
+
+@pytest.fixture(scope="session")
+def plugin_template(tmp_path_factory):
+    """Build a minimal plugin once per session. Read-only: do not write to it."""
+    plugin_dir = tmp_path_factory.mktemp("templates") / "test_plugin"
+    plugin_dir.mkdir()
+    (plugin_dir / "main.py").write_bytes(b"class Plugin: pass")
+    return plugin_dir
+
+
+@pytest.fixture
+def memory_vault(tmp_path):
+    """Create a throwaway vault with only the example memory plugin enabled."""
+    vault_path = tmp_path / "vault"
+    (vault_path / "plugins").mkdir(parents=True)
+    (vault_path / ".vault.json").write_bytes(b'{"plugins": {"memory": {"enabled": true}}}')
+    shutil.copytree(tailor_path / "example-vault" / "plugins" / "memory", vault_path / "plugins" / "memory")
+    (vault_path / ".memory").mkdir()
+    return vault_path
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on a single session-wide event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
@@ -36,3 +36,27 @@ async def test_event_priority():
     
     # Clean up
     brain.clear_subscribers("test.event")
+
+
+@pytest.mark.asyncio
+async def test_subscribe_after_publish():
+    from sidecar.event_bus import EventBus
+    events = EventBus()
+    execution_order = []
+
+    async def handler_low():
+        execution_order.append("low")
+
+    async def handler_high():
+        execution_order.append("high")
+
+    events.subscribe("test.event", handler_low, priority=1)
+    await events.publish("test.event", sequential=True)
+
+    # Subscribing and unsubscribing after a publish must be seen by the next one
+    events.subscribe("test.event", handler_high, priority=20)
+    await events.publish("test.event", sequential=True)
+    events.unsubscribe("test.event", handler_low)
+    await events.publish("test.event", sequential=True)
+
+    assert execution_order == ["low", "high", "low", "high"]
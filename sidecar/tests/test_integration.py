@@ -37,19 +37,33 @@ class Plugin(PluginBase):
         return {"emitted": True}
 """
 
+# Fail at import on a broken plugin string instead of deep inside brain.initialize()
+_PLUGIN_CODE = compile(TEST_PLUGIN_CODE, "integration_test_plugin/main.py", "exec")
+
+def _last_sent(ws):
+    """Return the last JSON-RPC message sent to Rust."""
+    return ws.send_to_rust.call_args.args[0]
+
 # ----------------------------------------------------------------------------
 # Fixtures
 # ----------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def mock_ws_server():
-    """Mock WebSocket server."""
+    """Mock WebSocket server, built once per test class."""
     server = MagicMock(spec=WebSocketServer)
     server.send = AsyncMock()
     server.send_to_rust = MagicMock()
     server.command_handlers = {}
     return server
 
+@pytest.fixture(autouse=True)
+def _reset_ws(mock_ws_server):
+    """Clear recorded calls on the shared server after each test."""
+    yield
+    mock_ws_server.reset_mock()
+    mock_ws_server.command_handlers.clear()
+
 @pytest.fixture
 def integration_vault(tmp_path):
     """Create a temporary vault with a test plugin."""
@@ -110,12 +124,13 @@ class TestIntegration:
         # Verify mock server received the event
         # ws_server.send_to_rust should be called with JSON-RPC notification
         assert mock_ws_server.send_to_rust.called
-        call_args = mock_ws_server.send_to_rust.call_args[0][0] # First arg of last call
+        sent = _last_sent(mock_ws_server)
+        assert sent["method"] == "trigger_event"
         
         # Check structure of sent message
-        assert call_args["method"] == "trigger_event"
-        assert call_args["params"]["event_type"] == "custom.event"
-        assert call_args["params"]["data"] == event_data
+        params = sent["params"]
+        assert params["event_type"] == "custom.event"
+        assert params["data"] == event_data
         
     async def test_invalid_command_handling(self, integration_vault, mock_ws_server):
         """Test system behavior when executing non-existent command."""
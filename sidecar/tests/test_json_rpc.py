@@ -4,11 +4,18 @@ Unit tests for JSON-RPC utilities.
 Tests message building, validation, and helper functions.
 """
 
+import json
+
 import pytest
 from sidecar import utils
 from sidecar import exceptions
 
 
+# Shared read-only messages; copy before mutating
+_REQUEST = {"jsonrpc": "2.0", "method": "test", "id": 1}
+_NOTIFICATION = {"jsonrpc": "2.0", "method": "notify"}
+
+
 @pytest.mark.unit
 class TestBuildFunctions:
     """Test message building functions."""
@@ -22,6 +29,39 @@ class TestBuildFunctions:
         assert msg["params"] == {"arg": "value"}
         assert msg["id"] == 1
     
+    def test_build_request_generates_unique_ids(self):
+        """Test generated request ids are unique even within one millisecond."""
+        ids = {utils.build_request("test.method")["id"] for _ in range(100)}
+        
+        assert len(ids) == 100
+        assert all(request_id.startswith("req_") for request_id in ids)
+    
+    @pytest.mark.parametrize("result", [{"text": "héllo", "n": 1}, {1: "int key"}, 2 ** 70])
+    def test_dumps_message(self, result):
+        """Test dumps_message output decodes to the same message as json.dumps."""
+        msg = utils.build_response(result, request_id=2)
+        
+        assert isinstance(utils.dumps_message(msg), str)
+        assert json.loads(utils.dumps_message(msg)) == json.loads(json.dumps(msg))
+    
+    def test_dumps_message_non_finite(self):
+        """Test NaN/inf encode as the stdlib does rather than as null."""
+        msg = utils.build_response([float("nan"), float("inf"), -float("inf")], request_id=2)
+        
+        assert utils.dumps_message(msg) == json.dumps(msg)
+    
+    @pytest.mark.parametrize("text", ['{"id": 1, "text": "héllo"}', '{"n": NaN}', '[9007199254740993]'])
+    def test_loads_message(self, text):
+        """Test loads_message accepts everything json.loads does."""
+        parsed = utils.loads_message(text)
+        
+        assert json.dumps(parsed) == json.dumps(json.loads(text))
+    
+    def test_loads_message_invalid(self):
+        """Test malformed input raises json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            utils.loads_message("not valid json")
+    
     def test_build_response(self):
         """Test building a response message."""
         msg = utils.build_response({"result": "data"}, request_id=2)
@@ -45,14 +85,9 @@ class TestBuildFunctions:
 class TestValidation:
     """Test message validation."""
     
-    def test_valid_request(self):
-        """Test validating a valid request."""
-        msg = {"jsonrpc": "2.0", "method": "test", "id": 1}
-        utils.validate_jsonrpc_message(msg)  # Should not raise
-    
-    def test_valid_notification(self):
-        """Test validating a valid notification (no id)."""
-        msg = {"jsonrpc": "2.0", "method": "notify"}
+    @pytest.mark.parametrize("msg", [_REQUEST, _NOTIFICATION], ids=["request", "notification"])
+    def test_valid_request(self, msg):
+        """Test validating a valid request and a notification (no id)."""
         utils.validate_jsonrpc_message(msg)  # Should not raise
     
     def test_invalid_version(self):
@@ -66,6 +101,31 @@ class TestValidation:
         msg = {"jsonrpc": "2.0", "id": 1}
         with pytest.raises(exceptions.JSONRPCError):
             utils.validate_jsonrpc_message(msg)
+    
+    @pytest.mark.parametrize("msg", [[_REQUEST], "test", None])
+    def test_non_object_message(self, msg):
+        """Test a message that is not a JSON object is an invalid request."""
+        with pytest.raises(exceptions.JSONRPCError, match="object"):
+            utils.validate_jsonrpc_message(msg)
+    
+    def test_valid_response(self):
+        """Test validating success and error responses."""
+        utils.validate_jsonrpc_message({"jsonrpc": "2.0", "result": None, "id": 1})
+        utils.validate_jsonrpc_message(
+            {"jsonrpc": "2.0", "error": {"code": -32600, "message": "bad"}, "id": 1}
+        )
+    
+    def test_response_with_result_and_error(self):
+        """Test a response cannot carry both result and error."""
+        msg = {"jsonrpc": "2.0", "result": 1, "error": {"code": 1, "message": "x"}, "id": 1}
+        with pytest.raises(exceptions.JSONRPCError, match="both"):
+            utils.validate_jsonrpc_message(msg)
+    
+    def test_error_missing_code(self):
+        """Test error objects must have code and message."""
+        msg = {"jsonrpc": "2.0", "error": {"message": "x"}, "id": 1}
+        with pytest.raises(exceptions.JSONRPCError, match="'code' and 'message'"):
+            utils.validate_jsonrpc_message(msg)
 
 
 @pytest.mark.unit
@@ -83,16 +143,22 @@ class TestHelpers:
     
     def test_get_params(self):
         """Test get_params helper."""
-        msg_with_params = {"jsonrpc": "2.0", "method": "test", "params": {"key": "val"}}
-        msg_without_params = {"jsonrpc": "2.0", "method": "test"}
+        msg_with_params = {**_REQUEST, "params": {"key": "val"}}
         
         assert utils.get_params(msg_with_params) == {"key": "val"}
-        assert utils.get_params(msg_without_params) == {}
+        assert utils.get_params(_REQUEST) == {}
     
-    def test_get_request_id(self):
+    @pytest.mark.parametrize("msg, expected", [(_REQUEST, 1), (_NOTIFICATION, None)])
+    def test_get_request_id(self, msg, expected):
         """Test get_request_id helper."""
-        request = {"jsonrpc": "2.0", "method": "test", "id": 42}
-        notification = {"jsonrpc": "2.0", "method": "notify"}
-        
-        assert utils.get_request_id(request) == 42
-        assert utils.get_request_id(notification) is None
+        assert utils.get_request_id(msg) == expected
+    
+    @pytest.mark.parametrize("msg, expected", [
+        (_REQUEST, (1, "test", {})),
+        ({**_REQUEST, "params": {"key": "val"}}, (1, "test", {"key": "val"})),
+        ({**_REQUEST, "params": [1, 2]}, (1, "test", {"args": [1, 2]})),
+        (_NOTIFICATION, (None, "notify", {})),
+    ])
+    def test_unpack_request(self, msg, expected):
+        """Test unpack_request matches the individual getters."""
+        assert utils.unpack_request(msg) == expected
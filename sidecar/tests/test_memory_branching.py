@@ -1,42 +1,41 @@
 import pytest
 import asyncio
 import json
-import shutil
 from pathlib import Path
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock
 
 from sidecar.vault_brain import VaultBrain
-from sidecar.services.llm_service import LLMService
+from sidecar.services.llm_service import LLMService, LLMResponse
 
+@pytest.mark.xdist_group("vault_singleton")
 @pytest.mark.asyncio
-async def test_memory_branching():
+async def test_memory_branching(fresh_vault_brain, memory_vault):
     # Setup paths
-    vault_path = Path("/home/arc/Dev/tailor/example-vault")
+    vault_path = memory_vault
     memory_dir = vault_path / ".memory"
     chat_id = "chat_branch_test"
     memory_file = memory_dir / f"{chat_id}.json"
     
-    # Clean up
-    if memory_dir.exists():
-        shutil.rmtree(memory_dir)
-        
-    # Reset Singleton
-    if VaultBrain._instance:
-        VaultBrain._instance = None
+    def load_mem():
+        return json.loads(memory_file.read_bytes())
     
     # Initialize
     brain = VaultBrain(vault_path, MagicMock())
     
     # Mock LLM
     mock_llm = MagicMock(spec=LLMService)
-    mock_llm.complete = AsyncMock()
     # Responses:
     # 1. Main branch response
     # 2. Side branch response
-    mock_llm.complete.side_effect = [
-        MagicMock(content="Response 1", model="test", usage={}),
-        MagicMock(content="Response 2", model="test", usage={})
-    ]
+    responses = iter([
+        LLMResponse(content="Response 1", model="test"),
+        LLMResponse(content="Response 2", model="test"),
+    ])
+    
+    async def fake_complete(*args, **kwargs):
+        return next(responses)
+    
+    mock_llm.complete = fake_complete
     
     await brain.initialize()
     brain._llm_service = mock_llm
@@ -48,8 +47,7 @@ async def test_memory_branching():
     await brain.chat_send(message="Msg 1", chat_id=chat_id)
     
     # Verify file
-    with open(memory_file, "r") as f:
-        data = json.load(f)
+    data = load_mem()
     assert data["active_branch"] == "main"
     assert len(data["branches"]["main"]) == 2
     
@@ -70,8 +68,7 @@ async def test_memory_branching():
     assert result["history"][0]["content"] == "Msg 1"
     
     # Verify file updated
-    with open(memory_file, "r") as f:
-        data = json.load(f)
+    data = load_mem()
     assert data["active_branch"] == "experiment_a"
     assert "experiment_a" in data["branches"]
     assert len(data["branches"]["experiment_a"]) == 1
@@ -82,9 +79,7 @@ async def test_memory_branching():
     await brain.chat_send(message="Msg 2", chat_id=chat_id)
     
     # Verify file
-    with open(memory_file, "r") as f:
-        data = json.load(f)
-        
+    data = load_mem()
     branch_hist = data["branches"]["experiment_a"]
     # Should have: Msg 1, Msg 2, Response 2
     assert len(branch_hist) == 3
@@ -99,5 +94,3 @@ async def test_memory_branching():
     
     # Cleanup
     await brain.shutdown()
-    if memory_dir.exists():
-        shutil.rmtree(memory_dir)
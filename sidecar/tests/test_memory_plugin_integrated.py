@@ -1,29 +1,20 @@
 import pytest
 import asyncio
 import json
-import shutil
 from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock
 
 from sidecar.vault_brain import VaultBrain
 from sidecar.services.llm_service import LLMService
 
+@pytest.mark.xdist_group("vault_singleton")
 @pytest.mark.asyncio
-async def test_memory_plugin_integrated():
+async def test_memory_plugin_integrated(fresh_vault_brain, memory_vault):
     # Setup paths
-    vault_path = Path("/home/arc/Dev/tailor/example-vault")
+    vault_path = memory_vault
     memory_dir = vault_path / ".memory"
     memory_file = memory_dir / "chat_default.json"
     
-    # Clean up previous memory
-    if memory_dir.exists():
-        shutil.rmtree(memory_dir)
-        
-    # Initialize Brain
-    # Force singleton reset if needed (though pytest runs usually isolate or we can patch)
-    if VaultBrain._instance:
-        VaultBrain._instance = None
-    
     # Mock WebSocket
     ws_mock = MagicMock()
     brain = VaultBrain(vault_path, ws_mock)
@@ -109,5 +100,3 @@ async def test_memory_plugin_integrated():
     
     # Cleanup
     await brain.shutdown()
-    if memory_dir.exists():
-        shutil.rmtree(memory_dir)
@@ -16,14 +16,10 @@ from sidecar import exceptions
 class TestValidateVaultPath:
     """Test vault path validation."""
     
-    def test_valid_vault_path(self, tmp_path):
+    def test_valid_vault_path(self, vault_template):
         """Test validating an existing vault directory."""
-        vault_path = tmp_path / "test_vault"
-        vault_path.mkdir()
-        (vault_path / ".vault.json").write_text("{}")
-        
         # Should not raise
-        utils.validate_vault_path(vault_path)
+        utils.validate_vault_path(vault_template)
     
     def test_nonexistent_vault(self):
         """Test validation fails for nonexistent path."""
@@ -32,10 +28,31 @@ class TestValidateVaultPath:
         with pytest.raises(exceptions.VaultNotFoundError):
             utils.validate_vault_path(fake_path)
     
+    def test_missing_vault_cache_cleared_by_ensure_directory(self, tmp_path):
+        """Test ensure_directory drops the cached miss for the vault it creates."""
+        vault_path = tmp_path / "late_vault"
+        with pytest.raises(exceptions.VaultNotFoundError):
+            utils.validate_vault_path(vault_path)
+        
+        utils.ensure_directory(vault_path)
+        assert utils.validate_vault_path(vault_path) == vault_path.resolve()
+    
+    def test_missing_vault_cache_expires(self, tmp_path, monkeypatch):
+        """Test a cached miss is re-checked once its TTL has passed."""
+        now = [1000.0]
+        monkeypatch.setattr(utils.time, "monotonic", lambda: now[0])
+        vault_path = tmp_path / "late_vault"
+        with pytest.raises(exceptions.VaultNotFoundError):
+            utils.validate_vault_path(vault_path)
+        
+        vault_path.mkdir()
+        now[0] += utils._MISSING_VAULT_TTL
+        assert utils.validate_vault_path(vault_path) == vault_path.resolve()
+    
     def test_vault_is_file_not_directory(self, tmp_path):
         """Test validation fails if vault path is a file."""
         vault_file = tmp_path / "vault.txt"
-        vault_file.write_text("not a directory")
+        vault_file.write_bytes(b"not a directory")
         
         with pytest.raises(exceptions.InvalidPathError, match="not a directory"):
             utils.validate_vault_path(vault_file)
@@ -51,18 +68,88 @@ class TestValidateVaultPath:
 
 
 
+@pytest.mark.unit
+class TestDiscoverPlugins:
+    """Test plugin discovery."""
+    
+    def test_discover_multiple_plugins(self, tmp_path):
+        """Test discovery returns plugin dirs sorted by name."""
+        for name in ("zeta", "alpha"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "main.py").write_bytes(b"class Plugin: pass")
+        
+        plugins = utils.discover_plugins(tmp_path)
+        
+        assert [p.name for p in plugins] == ["alpha", "zeta"]
+    
+    def test_parallel_matches_serial(self, tmp_path):
+        """Test the thread pool path finds the same plugins as a serial scan."""
+        for i in range(12):
+            (tmp_path / f"plugin_{i:02d}").mkdir()
+            if i % 3:
+                (tmp_path / f"plugin_{i:02d}" / "main.py").write_bytes(b"class Plugin: pass")
+        
+        parallel = utils.discover_plugins(tmp_path, parallel=True)
+        utils.clear_discover_cache()
+        serial = utils.discover_plugins(tmp_path, parallel=False)
+        
+        assert parallel == serial
+        assert len(parallel) == 8
+    
+    def test_ignore_non_plugins(self, tmp_path):
+        """Test files, hidden/private dirs and dirs without a main.py file are skipped."""
+        (tmp_path / "notes.txt").write_bytes(b"not a plugin")
+        (tmp_path / "no_main").mkdir()
+        (tmp_path / "main_is_dir" / "main.py").mkdir(parents=True)
+        for name in (".hidden", "_private"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "main.py").write_bytes(b"class Plugin: pass")
+        
+        assert utils.discover_plugins(tmp_path) == []
+    
+    def test_symlinked_plugin(self, tmp_path):
+        """Test a symlink to a plugin directory is discovered."""
+        target = tmp_path / "elsewhere"
+        target.mkdir()
+        (target / "main.py").write_bytes(b"class Plugin: pass")
+        plugins_dir = tmp_path / "plugins"
+        plugins_dir.mkdir()
+        (plugins_dir / "linked").symlink_to(target, target_is_directory=True)
+        
+        assert utils.discover_plugins(plugins_dir) == [plugins_dir / "linked"]
+    
+    def test_cache_clear(self, tmp_path):
+        """Test a cleared cache picks up plugins changed in place."""
+        plugin_dir = tmp_path / "late_plugin"
+        plugin_dir.mkdir()
+        assert utils.discover_plugins(tmp_path) == []
+        
+        # Adding main.py does not change the plugins dir mtime
+        (plugin_dir / "main.py").write_bytes(b"class Plugin: pass")
+        utils.clear_discover_cache()
+        
+        assert utils.discover_plugins(tmp_path) == [plugin_dir]
+    
+    def test_get_plugins_dir(self, tmp_path):
+        """Test get_plugins_dir only returns an existing directory."""
+        assert utils.get_plugins_dir(tmp_path) is None
+        
+        (tmp_path / "plugins").write_bytes(b"")
+        assert utils.get_plugins_dir(tmp_path) is None
+        
+        (tmp_path / "plugins").unlink()
+        (tmp_path / "plugins").mkdir()
+        assert utils.get_plugins_dir(tmp_path) == tmp_path / "plugins"
+
+
 @pytest.mark.unit
 class TestValidatePluginStructure:
     """Test plugin structure validation."""
     
-    def test_valid_plugin_structure(self, tmp_path):
+    def test_valid_plugin_structure(self, plugin_template):
         """Test validating a plugin with proper structure."""
-        plugin_dir = tmp_path / "my_plugin"
-        plugin_dir.mkdir()
-        (plugin_dir / "main.py").write_text("class Plugin: pass")
-        
         # Should not raise
-        utils.validate_plugin_structure(plugin_dir)
+        utils.validate_plugin_structure(plugin_template)
     
     def test_missing_main_py(self, tmp_path):
         """Test validation fails without main.py."""
@@ -76,9 +163,9 @@ class TestValidatePluginStructure:
         """Test plugin with optional settings.json and README."""
         plugin_dir = tmp_path / "full_plugin"
         plugin_dir.mkdir()
-        (plugin_dir / "main.py").write_text("class Plugin: pass")
-        (plugin_dir / "settings.json").write_text("{}")
-        (plugin_dir / "README.md").write_text("# Plugin")
+        (plugin_dir / "main.py").write_bytes(b"class Plugin: pass")
+        (plugin_dir / "settings.json").write_bytes(b"{}")
+        (plugin_dir / "README.md").write_bytes(b"# Plugin")
         
         # Should still validate successfully
         utils.validate_plugin_structure(plugin_dir)
@@ -24,7 +24,7 @@ from sidecar.pipeline.nodes import PipelineNodes
 
 @pytest.mark.unit
 def test_pipeline_context_validation():
-    """Test Pydantic validation for PipelineContext."""
+    """Test PipelineContext construction and helpers."""
     # 1. Valid Creation
     ctx = PipelineContext(message="hello", original_message="hello")
     assert ctx.message == "hello"
@@ -40,6 +40,21 @@ def test_pipeline_context_validation():
     assert ctx.should_abort is True
     assert ctx.abort_reason == "stop"
 
+@pytest.mark.unit
+def test_pipeline_context_model_dump_copies_containers():
+    """Test model_dump snapshots survive later mutation of the context."""
+    ctx = PipelineContext(message="hello", original_message="hello")
+    dumped = ctx.model_dump()
+
+    ctx.history.append({"role": "user", "content": "hello"})
+    ctx.add_metadata("key", "value")
+    ctx.events_emitted.append("done")
+
+    assert dumped["history"] == []
+    assert dumped["metadata"] == {}
+    assert dumped["events_emitted"] == []
+    assert dumped["message"] == "hello"
+
 @pytest.mark.unit
 def test_pipeline_config_defaults():
     """Test PipelineConfig defaults."""
@@ -96,6 +111,11 @@ class TestPipelineNodes:
 # Test DefaultPipeline (Integration)
 # =============================================================================
 
+@pytest.fixture(scope="class")
+def pipeline():
+    """Compile the LangGraph pipeline once per test class."""
+    return DefaultPipeline(PipelineConfig())
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 class TestDefaultPipeline:
@@ -108,10 +128,7 @@ class TestDefaultPipeline:
             mock_get.return_value = mock_brain
             yield mock_brain
 
-    async def test_full_run_success(self, mock_brain):
-        config = PipelineConfig()
-        pipeline = DefaultPipeline(config)
-        
+    async def test_full_run_success(self, mock_brain, pipeline):
         # We can't easily hook into "INPUT" event via manager anymore since manager is gone.
         # But we can verify that events were published via mock_brain.
         
@@ -124,10 +141,7 @@ class TestDefaultPipeline:
         event_names = [call.args[0] for call in mock_brain.publish.call_args_list]
         assert PipelineEvents.END in event_names
 
-    async def test_pipeline_abort_stops_execution(self, mock_brain):
-        config = PipelineConfig()
-        pipeline = DefaultPipeline(config)
-        
+    async def test_pipeline_abort_stops_execution(self, mock_brain, pipeline):
         # Simulate an aborter hook
         async def mock_publish(event, sequential=False, ctx=None, **kwargs):
             if event == PipelineEvents.INPUT and ctx:
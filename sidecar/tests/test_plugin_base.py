@@ -6,6 +6,10 @@ Verifies that:
 - Lifecycle hooks work correctly
 - UI helper methods delegate to brain correctly
 """
+import math
+import os
+import stat
+
 import pytest
 import sys
 from pathlib import Path
@@ -16,6 +20,11 @@ from sidecar import constants
 from sidecar import exceptions
 
 
+_EVT_PROGRESS = constants.EventType.PROGRESS
+_EVT_UI_COMMAND = constants.EventType.UI_COMMAND
+_SCOPE_WINDOW = constants.EventScope.WINDOW
+
+
 class ConcretePlugin(PluginBase):
     """Concrete implementation for testing."""
     
@@ -23,9 +32,9 @@ class ConcretePlugin(PluginBase):
         pass
 
 
-@pytest.fixture
-def mock_brain():
-    """Create a mock VaultBrain."""
+@pytest.fixture(scope="module")
+def _module_brain():
+    """Create a mock VaultBrain once per module."""
     brain = MagicMock()
     brain.emit_to_frontend = MagicMock()
     brain.notify_frontend = MagicMock()
@@ -36,19 +45,28 @@ def mock_brain():
 
 
 @pytest.fixture
-def plugin_dir(tmp_path):
-    """Create a temporary plugin directory."""
-    plugin_path = tmp_path / "test_plugin"
-    plugin_path.mkdir()
-    return plugin_path
+def mock_brain(_module_brain):
+    """Reuse the module-scoped mock VaultBrain with call history cleared."""
+    _module_brain.reset_mock()
+    return _module_brain
 
 
 @pytest.fixture
-def vault_path(tmp_path):
-    """Create a temporary vault directory."""
-    vault = tmp_path / "test_vault"
-    vault.mkdir()
-    return vault
+def plugin_dir(plugin_template):
+    """Use the shared plugin template; these tests never write to it."""
+    return plugin_template
+
+
+@pytest.fixture
+def vault_path(vault_template):
+    """Use the shared vault template; these tests never write to it."""
+    return vault_template
+
+
+@pytest.fixture
+def plugin(plugin_dir, vault_path):
+    """Create a ConcretePlugin on the shared template directories."""
+    return ConcretePlugin(plugin_dir, vault_path)
 
 
 class TestPluginBase:
@@ -71,19 +89,15 @@ class TestPluginBase:
         
         assert plugin.config == config
 
-    def test_brain_property_access(self, plugin_dir, vault_path, mock_brain):
+    def test_brain_property_access(self, plugin, mock_brain):
         """Verify brain property retrieves singleton."""
-        plugin = ConcretePlugin(plugin_dir, vault_path)
-        
         # Mock VaultBrain.get() to return our mock_brain
         with patch("sidecar.vault_brain.VaultBrain.get", return_value=mock_brain):
             assert plugin.brain == mock_brain
 
     @pytest.mark.asyncio
-    async def test_lifecycle_flags(self, plugin_dir, vault_path):
+    async def test_lifecycle_flags(self, plugin):
         """Verify on_load/on_unload update flags."""
-        plugin = ConcretePlugin(plugin_dir, vault_path)
-        
         assert not plugin.is_loaded
         await plugin.on_load()
         assert plugin.is_loaded
@@ -91,71 +105,111 @@ class TestPluginBase:
         await plugin.on_unload()
         assert not plugin.is_loaded
 
-    def test_notify_delegates_to_brain(self, plugin_dir, vault_path, mock_brain):
+    def test_notify_delegates_to_brain(self, plugin, mock_brain):
         """Verify notify calls brain.notify_frontend."""
-        plugin = ConcretePlugin(plugin_dir, vault_path)
-        
         with patch("sidecar.vault_brain.VaultBrain.get", return_value=mock_brain):
             plugin.notify("Hello", "success")
             
             mock_brain.notify_frontend.assert_called_with("Hello", "success")
 
-    def test_progress_delegates_to_brain(self, plugin_dir, vault_path, mock_brain):
+    def test_progress_delegates_to_brain(self, plugin, mock_brain):
         """Verify progress calls brain.emit_to_frontend."""
-        plugin = ConcretePlugin(plugin_dir, vault_path)
-        
         with patch("sidecar.vault_brain.VaultBrain.get", return_value=mock_brain):
             plugin.progress(50, "Loading")
             
             mock_brain.emit_to_frontend.assert_called_with(
-                constants.EventType.PROGRESS,
+                _EVT_PROGRESS,
                 {"percentage": 50, "message": "Loading"}
             )
 
-    def test_update_state_delegates_to_brain(self, plugin_dir, vault_path, mock_brain):
+    def test_update_state_delegates_to_brain(self, plugin, mock_brain):
         """Verify update_state calls brain.update_state."""
-        plugin = ConcretePlugin(plugin_dir, vault_path)
-        
         with patch("sidecar.vault_brain.VaultBrain.get", return_value=mock_brain):
             plugin.update_state("key", "value")
             
             mock_brain.update_state.assert_called_with("key", "value")
 
     @pytest.mark.asyncio
-    async def test_publish_delegates_to_brain(self, plugin_dir, vault_path, mock_brain):
+    async def test_publish_delegates_to_brain(self, plugin, mock_brain):
         """Verify publish calls brain.publish."""
-        plugin = ConcretePlugin(plugin_dir, vault_path)
-        
         with patch("sidecar.vault_brain.VaultBrain.get", return_value=mock_brain):
             await plugin.publish("my.event", data=123)
             
             mock_brain.publish.assert_called_with("my.event", data=123)
 
     @pytest.mark.asyncio
-    async def test_register_sidebar_view(self, plugin_dir, vault_path, mock_brain):
+    async def test_register_sidebar_view(self, plugin, mock_brain):
         """Verify register_sidebar_view emits UI_COMMAND."""
-        plugin = ConcretePlugin(plugin_dir, vault_path)
-        
         with patch("sidecar.vault_brain.VaultBrain.get", return_value=mock_brain):
             await plugin.register_sidebar_view("id", "icon", "Title")
             
             mock_brain.emit_to_frontend.assert_called()
             call_args = mock_brain.emit_to_frontend.call_args
             
-            assert call_args.kwargs["event_type"] == constants.EventType.UI_COMMAND
+            assert call_args.kwargs["event_type"] == _EVT_UI_COMMAND
             assert call_args.kwargs["data"]["action"] == "register_sidebar"
-            assert call_args.kwargs["scope"] == constants.EventScope.WINDOW
+            assert call_args.kwargs["scope"] == _SCOPE_WINDOW
 
     @pytest.mark.asyncio
-    async def test_set_sidebar_content(self, plugin_dir, vault_path, mock_brain):
+    async def test_set_sidebar_content(self, plugin, mock_brain):
         """Verify set_sidebar_content emits UI_COMMAND."""
-        plugin = ConcretePlugin(plugin_dir, vault_path)
-        
         with patch("sidecar.vault_brain.VaultBrain.get", return_value=mock_brain):
             await plugin.set_sidebar_content("id", "<html>")
             
             mock_brain.emit_to_frontend.assert_called()
             call_args = mock_brain.emit_to_frontend.call_args
             
-            assert call_args.kwargs["event_type"] == constants.EventType.UI_COMMAND
+            assert call_args.kwargs["event_type"] == _EVT_UI_COMMAND
             assert call_args.kwargs["data"]["action"] == "set_sidebar"
+
+    def test_overridden_hooks(self):
+        """Verify subclasses record which no-op hooks they replace."""
+        class TickingPlugin(ConcretePlugin):
+            async def on_tick(self) -> None:
+                pass
+        
+        assert ConcretePlugin._overridden_hooks == frozenset()
+        assert TickingPlugin._overridden_hooks == {"on_tick"}
+
+    def test_settings_round_trip(self, tmp_path, vault_path):
+        """Verify saved settings load back unchanged."""
+        plugin = ConcretePlugin(tmp_path, vault_path)
+        settings = {"enabled": True, "model": "gpt-4", "limits": {"tokens": 512}}
+        
+        assert plugin.load_settings() == {}
+        assert plugin.save_settings(settings) is True
+        assert plugin.load_settings() == settings
+        assert plugin.save_settings({"enabled": False}, durable=True) is True
+        assert plugin.load_settings() == {"enabled": False}
+        assert [p.name for p in tmp_path.iterdir()] == ["settings.json"]
+
+    @pytest.mark.parametrize("value", [2 ** 70 + 1, float("nan"), float("inf")])
+    def test_settings_keep_values_orjson_cannot(self, tmp_path, vault_path, value):
+        """Verify wide ints and non-finite floats are saved as-is, not dropped or nulled."""
+        plugin = ConcretePlugin(tmp_path, vault_path)
+        
+        assert plugin.save_settings({"value": value}) is True
+        loaded = plugin.load_settings()["value"]
+        assert loaded == value or (math.isnan(value) and math.isnan(loaded))
+        assert type(loaded) is type(value)
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    def test_save_settings_keeps_file_mode(self, tmp_path, vault_path):
+        """Verify saving over an existing settings file keeps its permissions."""
+        plugin = ConcretePlugin(tmp_path, vault_path)
+        settings_file = tmp_path / "settings.json"
+        plugin.save_settings({"enabled": True})
+        settings_file.chmod(0o600)
+        
+        assert plugin.save_settings({"enabled": False}) is True
+        assert stat.S_IMODE(settings_file.stat().st_mode) == 0o600
+
+    def test_load_settings_sees_external_edits(self, tmp_path, vault_path):
+        """Verify cached settings are dropped when the file changes on disk."""
+        plugin = ConcretePlugin(tmp_path, vault_path)
+        plugin.save_settings({"enabled": True})
+        plugin.load_settings()["enabled"] = "mutated by caller"
+        assert plugin.load_settings() == {"enabled": True}
+        
+        (tmp_path / "settings.json").write_bytes(b'{"enabled": false, "edited": 1}')
+        assert plugin.load_settings() == {"enabled": False, "edited": 1}
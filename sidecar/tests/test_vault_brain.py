@@ -4,38 +4,62 @@ Unit tests for VaultBrain module.
 Tests initialization, plugin loading, and command registration.
 """
 
+import asyncio
+import copy
+import types
 import pytest
 from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from pathlib import Path
 import sys
 
-from sidecar.vault_brain import VaultBrain
+from sidecar.vault_brain import VaultBrain, _load_plugin_module
+from sidecar.event_bus import EventBus
 from sidecar import exceptions
 from sidecar import constants
 
+# Keep the module-scoped vault and brain template on one xdist worker
+pytestmark = pytest.mark.xdist_group("vaultbrain")
+
+
+def _stub_ws_server():
+    """A WebSocketServer stand-in that records outgoing messages in ``sent``."""
+    sent = []
+    return types.SimpleNamespace(
+        command_handlers={},
+        sent=sent,
+        send_to_rust=sent.append,
+        is_connected=lambda: False,
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_ws_server():
+    """Create a stub WebSocketServer once per module."""
+    return _stub_ws_server()
+
+
+@pytest.fixture(scope="module")
+def valid_vault(tmp_path_factory):
+    """Create a valid vault structure once per module. Tests must not modify it."""
+    vault_path = tmp_path_factory.mktemp("vault") / "test_vault"
+    vault_path.mkdir()
+    (vault_path / ".vault.json").write_text("{}")
+    return vault_path
+
+
+@pytest.fixture
+def scratch_vault(tmp_path):
+    """Create a valid vault structure that a test may modify."""
+    vault_path = tmp_path / "test_vault"
+    vault_path.mkdir()
+    (vault_path / ".vault.json").write_text("{}")
+    return vault_path
+
+
 @pytest.mark.unit
+@pytest.mark.usefixtures("fresh_vault_brain")
 class TestVaultBrain:
     """Test VaultBrain functionality."""
-    
-    @pytest.fixture
-    def mock_ws_server(self):
-        """Create a mock WebSocketServer."""
-        return Mock()
-
-    @pytest.fixture(autouse=True)
-    def reset_singleton(self):
-        """Reset VaultBrain singleton before and after each test."""
-        VaultBrain._instance = None
-        yield
-        VaultBrain._instance = None
-    
-    @pytest.fixture
-    def valid_vault(self, tmp_path):
-        """Create a valid vault structure."""
-        vault_path = tmp_path / "test_vault"
-        vault_path.mkdir()
-        (vault_path / ".vault.json").write_text("{}")
-        return vault_path
 
     @pytest.mark.asyncio
     async def test_init_valid_vault(self, valid_vault, mock_ws_server):
@@ -65,31 +89,24 @@ class TestVaultBrain:
         assert isinstance(brain.config, dict)
         
     @pytest.mark.asyncio
-    async def test_load_config_invalid_json(self, valid_vault, mock_ws_server):
+    async def test_load_config_invalid_json(self, scratch_vault, mock_ws_server):
         """Test loading invalid JSON configuration."""
-        (valid_vault / ".vault.json").write_text("{invalid json")
+        (scratch_vault / ".vault.json").write_text("{invalid json")
         
-        brain = VaultBrain(valid_vault, mock_ws_server)
+        brain = VaultBrain(scratch_vault, mock_ws_server)
         
         
-        brain = VaultBrain(valid_vault, mock_ws_server)
+        brain = VaultBrain(scratch_vault, mock_ws_server)
         
         # Should not raise, but fall back to defaults
         await brain.initialize()
-        assert brain.config["name"] == valid_vault.name
-
-    @patch("sidecar.utils.validate_plugin_structure")
+        assert brain.config["name"] == scratch_vault.name
 
-    @patch("sidecar.vault_brain.importlib.util.spec_from_file_location")
-    @patch("sidecar.vault_brain.importlib.util.module_from_spec")
     @pytest.mark.asyncio
-    async def test_load_plugins(self, mock_module, mock_spec, mock_validate, valid_vault, mock_ws_server):
+    async def test_load_plugins(self, scratch_vault, mock_ws_server, monkeypatch):
         """Test loading plugins."""
-        # Mock discovered plugin path by ensuring it exists in the valid_vault
-        plugin_path = valid_vault / "plugins" / "test_plugin"
-        # mock_discover.return_value = [plugin_path] -> We rely on filesystem now or need to mock get_plugins_dir if we want to isolate
-        # The test actually creates the directories later, so standard discovery should work if we create files BEFORE initialize
-
+        # Mock discovered plugin path by ensuring it exists in the scratch_vault
+        plugin_path = scratch_vault / "plugins" / "test_plugin"
         
         # Mock plugin module and class
         mock_plugin_instance = Mock()
@@ -99,23 +116,19 @@ class TestVaultBrain:
         
         mock_plugin_class = Mock(return_value=mock_plugin_instance)
         
-        # Create a mock module with the plugin class
-        mock_mod = MagicMock()
-        setattr(mock_mod, "Plugin", mock_plugin_class)
-        mock_module.return_value = mock_mod
-        
-        # Mock spec loader
-        mock_spec_obj = Mock()
-        mock_spec_obj.loader.exec_module = Mock()
-        mock_spec.return_value = mock_spec_obj
+        # Serve the mock class from an in-memory module; the real loader
+        # executes main.py, which just re-exports it
+        stub = types.ModuleType("_tailor_test_plugin_stub")
+        stub.Plugin = mock_plugin_class
+        monkeypatch.setitem(sys.modules, stub.__name__, stub)
         
         # Connect paths
         plugin_path.mkdir(parents=True, exist_ok=True)
-        (plugin_path / "main.py").touch()
+        (plugin_path / "main.py").write_text(f"from {stub.__name__} import Plugin\n")
         # Create settings.json to enable plugin
         (plugin_path / "settings.json").write_text('{"enabled": true, "key": "value"}')
 
-        brain = VaultBrain(valid_vault, mock_ws_server)
+        brain = VaultBrain(scratch_vault, mock_ws_server)
         await brain.initialize()
         
         # Verify plugin loaded
@@ -175,33 +188,74 @@ class TestVaultBrain:
         await brain.publish(constants.CoreEvents.TICK)
         mock_plugin.on_tick.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_activate_plugins_concurrently(self, valid_vault, mock_ws_server):
+        """Test on_load hooks run concurrently and one failure doesn't stop the rest."""
+        brain = VaultBrain(valid_vault, mock_ws_server)
+        ready = asyncio.Event()
+        
+        async def wait_for_other():
+            # Would time out if on_load hooks ran one after another
+            await asyncio.wait_for(ready.wait(), timeout=1)
+        
+        async def release_other():
+            ready.set()
+        
+        waiting = types.SimpleNamespace(on_load=wait_for_other, on_tick=AsyncMock())
+        releasing = types.SimpleNamespace(on_load=release_other, on_tick=AsyncMock())
+        failing = types.SimpleNamespace(on_load=AsyncMock(side_effect=RuntimeError("boom")))
+        brain.plugins.update(waiting=waiting, failing=failing, releasing=releasing)
+        
+        loaded = []
+        async def on_plugin_loaded(plugin_name):
+            loaded.append(plugin_name)
+        brain.subscribe(constants.CoreEvents.PLUGIN_LOADED, on_plugin_loaded)
+        
+        await brain._activate_plugins()
+        
+        assert loaded == ["waiting", "releasing"]
+
 
 
 
+def test_plugin_module_reused_until_changed(tmp_path):
+    """Test a plugin's main.py is executed once and re-executed only after an edit."""
+    main_file = tmp_path / "main.py"
+    main_file.write_bytes(b"class Plugin: pass\n")
+    
+    module = _load_plugin_module("cached_plugin", main_file)
+    assert _load_plugin_module("cached_plugin", main_file) is module
+    
+    main_file.write_bytes(b"class Plugin: version = 2\n")
+    reloaded = _load_plugin_module("cached_plugin", main_file)
+    assert reloaded is not module
+    assert reloaded.Plugin.version == 2
+
+
+@pytest.fixture(scope="module")
+def _brain_template(valid_vault):
+    """Construct a VaultBrain once per module for registry tests to copy."""
+    brain = VaultBrain(valid_vault, _stub_ws_server())
+    VaultBrain._instance = None
+    return brain
+
+
+@pytest.fixture
+def brain(_brain_template, fresh_vault_brain):
+    """Copy the template brain with empty registries; the copy becomes the singleton."""
+    # We don't necessarily need full initialize for registry unit tests if we just use register_command directly
+    brain = copy.copy(_brain_template)
+    brain.plugins = {}
+    brain.commands = {}
+    brain.events = EventBus()
+    return brain
+
+
 @pytest.mark.unit
+@pytest.mark.usefixtures("fresh_vault_brain")
 class TestCommandRegistry:
     """Test command registry functionality."""
     
-    @pytest.fixture(autouse=True)
-    def reset_singleton(self):
-        """Reset VaultBrain singleton."""
-        VaultBrain._instance = None
-        yield
-        VaultBrain._instance = None
-
-    @pytest.fixture
-    def brain(self, tmp_path):
-        """Create a VaultBrain instance with mocks."""
-        vault_path = tmp_path / "test_vault"
-        vault_path.mkdir()
-        (vault_path / ".vault.json").write_text("{}")
-        
-        ws_server = Mock()
-        ws_server.command_handlers = {}
-        brain = VaultBrain(vault_path, ws_server)
-        # We don't necessarily need full initialize for registry unit tests if we just use register_command directly
-        return brain
-
     def test_register_command_valid(self, brain):
         """Test registering a valid async command."""
         async def my_command():
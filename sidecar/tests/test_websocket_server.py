@@ -4,6 +4,8 @@ Unit tests for WebSocketServer module.
 Tests connection handling, JSON-RPC message processing, and command registration.
 """
 
+import copy
+from collections import deque
 import pytest
 import asyncio
 import json
@@ -14,25 +16,105 @@ from sidecar import exceptions
 from sidecar import utils
 from sidecar import constants
 
+# Keep the module-scoped fake vault_brain module on one xdist worker
+pytestmark = pytest.mark.xdist_group("wsserver")
+
+
+_ECHO_REQUEST_JSON = json.dumps(utils.build_request("test.echo", {"msg": "hello"}, request_id="1"))
+_UNKNOWN_REQUEST_JSON = json.dumps(utils.build_request("unknown", request_id="2"))
+_FAIL_REQUEST_JSON = json.dumps(utils.build_request("test.fail", request_id="3"))
+_BAD_PARAMS_REQUEST_JSON = json.dumps({"jsonrpc": "2.0", "method": "test.echo", "params": "x", "id": "4"})
+
+
+class _StubConn:
+    """Minimal connection that records sent payloads instead of mocking send."""
+    
+    def __init__(self):
+        self.sent = []
+    
+    async def send(self, data):
+        self.sent.append(data)
+    
+    async def close(self):
+        pass
+
+
+class _EmptyAsyncIter:
+    """Async iterator that is exhausted at once, like a socket closed on connect."""
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self):
+        raise StopAsyncIteration
+
+
+@pytest.fixture(scope="module")
+def _fake_vault_brain_module():
+    """Install a fake sidecar.vault_brain module once for the whole module."""
+    mock_brain = MagicMock()
+    mock_brain.execute_command = AsyncMock()
+    fake_mod = MagicMock(VaultBrain=MagicMock(get=MagicMock(return_value=mock_brain)))
+    with patch.dict('sys.modules', {'sidecar.vault_brain': fake_mod}):
+        yield mock_brain
+
+
+@pytest.fixture
+def fake_vault_brain(_fake_vault_brain_module):
+    """Return the fake brain with execute_command's behaviour and calls cleared."""
+    _fake_vault_brain_module.execute_command.reset_mock(return_value=True, side_effect=True)
+    return _fake_vault_brain_module
+
+
+@pytest.fixture(scope="module")
+def _server_template():
+    """Construct a WebSocketServer once per module for tests to copy."""
+    return WebSocketServer(port=9000)
+
+
+@pytest.fixture
+def server(_server_template):
+    """Copy the template server with fresh per-connection state."""
+    server = copy.copy(_server_template)
+    server.connection = None
+    server.message_queue = asyncio.Queue()
+    server.pending_messages = deque(maxlen=constants.WEBSOCKET_MAX_PENDING)
+    server._pending_overflowed = False
+    server._drain_task = None
+    server.brain = None
+    return server
+
+
+@pytest.fixture
+def conn(server):
+    """Attach a stub connection that records what the server sends."""
+    server.connection = _StubConn()
+    return server.connection
+
 
 @pytest.mark.unit
 class TestWebSocketServer:
     """Test WebSocketServer functionality."""
     
-    @pytest.fixture
-    def server(self):
-        """Create a WebSocketServer instance."""
-        return WebSocketServer(port=9000)
-    
     @pytest.fixture
     def mock_ws(self):
-        """Create a mock WebSocket connection."""
-        ws = AsyncMock()
+        """Create a mock WebSocket connection that yields no messages."""
+        ws = Mock()
         ws.send = AsyncMock()
         ws.close = AsyncMock()
         ws.remote_address = ("127.0.0.1", 12345)
+        ws.__aiter__ = lambda self: _EmptyAsyncIter()
         return ws
         
+    def test_pending_messages_bounded(self, server):
+        """Test messages queued before the loop starts drop oldest when full."""
+        server.pending_messages = deque(maxlen=2)
+        
+        for n in range(3):
+            server.send_to_rust({"n": n})
+        
+        assert list(server.pending_messages) == [{"n": 1}, {"n": 2}]
+    
     def test_init(self, server):
         """Test server initialization."""
         assert server.port == 9000
@@ -42,107 +124,94 @@ class TestWebSocketServer:
         assert not hasattr(server, "command_handlers")
 
     @pytest.mark.asyncio
-    async def test_handle_message_valid_request(self, server):
-        """Test processing a valid request via VaultBrain."""
-        # Mock VaultBrain
-        mock_brain = MagicMock()
-        mock_brain.execute_command = AsyncMock(return_value={"status": "ok"})
+    @pytest.mark.parametrize("payload, side_effect, expected", [
+        pytest.param(
+            _ECHO_REQUEST_JSON, None,
+            {"id": "1", "result": {"status": "ok"}},
+            id="valid_request",
+        ),
+        pytest.param(
+            _UNKNOWN_REQUEST_JSON, exceptions.CommandNotFoundError("unknown", []),
+            {"id": "2", "error": constants.JSONRPC_METHOD_NOT_FOUND},
+            id="method_not_found",
+        ),
+        pytest.param(
+            "not valid json", None,
+            {"id": None, "error": constants.JSONRPC_PARSE_ERROR},
+            id="invalid_json",
+        ),
+        pytest.param(
+            "[]", None,
+            {"id": None, "error": constants.JSONRPC_INVALID_REQUEST},
+            id="not_an_object",
+        ),
+        pytest.param(
+            '{"jsonrpc": "2.0", "result": {"status": "ok"}, "id": "7"}', None, None,
+            id="response_object",
+        ),
+        pytest.param(
+            _BAD_PARAMS_REQUEST_JSON, None,
+            {"id": "4", "error": constants.JSONRPC_INVALID_PARAMS},
+            id="invalid_request",
+        ),
+        pytest.param(
+            '{"jsonrpc": "2.0", "method": "", "id": "5"}', None,
+            {"id": "5", "error": constants.JSONRPC_INVALID_REQUEST},
+            id="missing_method",
+        ),
+        pytest.param(
+            _FAIL_REQUEST_JSON, ValueError("Handler failed"),
+            {"id": "3", "error": constants.JSONRPC_INTERNAL_ERROR},
+            id="handler_exception",
+        ),
+    ])
+    async def test_handle_message(self, server, conn, fake_vault_brain, payload, side_effect, expected):
+        """Test requests are executed via VaultBrain and answered over JSON-RPC."""
+        fake_vault_brain.execute_command.return_value = {"status": "ok"}
+        fake_vault_brain.execute_command.side_effect = side_effect
         
-        with patch.dict('sys.modules', {'sidecar.vault_brain': MagicMock(VaultBrain=MagicMock(get=MagicMock(return_value=mock_brain)))}):
-            
-            # Mock connection to verify response
-            server.connection = Mock()
-            server.connection.send = AsyncMock()
-            server.connection.close = AsyncMock()
-            
-            request = utils.build_request("test.echo", {"msg": "hello"}, request_id="1")
-            
-            await server.handle_message(json.dumps(request))
-            
-            # Check Brain called
-            mock_brain.execute_command.assert_called_once_with("test.echo", msg="hello")
-            
-            # Check response sent
-            server.connection.send.assert_called_once()
-            response_str = server.connection.send.call_args[0][0]
-            response = json.loads(response_str)
-            
-            assert response["result"] == {"status": "ok"}
-            assert response["id"] == "1"
-
-    @pytest.mark.asyncio
-    async def test_handle_message_method_not_found(self, server):
-        """Test unknown method."""
-        # Mock VaultBrain to raise CommandNotFoundError -> causes MethodNotFoundError
-        # Or specifically mocking _execute_request failure
-        
-        server.connection = Mock()
-        server.connection.send = AsyncMock()
-        server.connection.close = AsyncMock()
+        await server.handle_message(payload)
         
-        request = utils.build_request("unknown", request_id="2")
+        # Responses are never answered
+        if expected is None:
+            assert conn.sent == []
+            return
         
-        # We need to act as if VaultBrain raises exception
-        mock_brain = MagicMock()
-        mock_brain.execute_command = AsyncMock(side_effect=exceptions.CommandNotFoundError("unknown", []))
+        assert len(conn.sent) == 1
+        response = json.loads(conn.sent[0])
+        assert response["id"] == expected["id"]
         
-        with patch.dict('sys.modules', {'sidecar.vault_brain': MagicMock(VaultBrain=MagicMock(get=MagicMock(return_value=mock_brain)))}):
+        if "result" in expected:
+            fake_vault_brain.execute_command.assert_called_once_with("test.echo", msg="hello")
+            assert response["result"] == expected["result"]
+        else:
+            assert response["error"]["code"] == expected["error"]
         
-            await server.handle_message(json.dumps(request))
-            
-            # Verify method not found error sent
-            server.connection.send.assert_called_once()
-            response_str = server.connection.send.call_args[0][0]
-            response = json.loads(response_str)
-            
-            assert "error" in response
-            assert response["error"]["code"] == constants.JSONRPC_METHOD_NOT_FOUND
+        if isinstance(side_effect, ValueError):
+            message = response["error"]["message"]
+            assert "Handler failed" in message or "ValueError" in message
 
     @pytest.mark.asyncio
-    async def test_handle_message_invalid_json(self, server):
-        """Test malformed JSON."""
-        server.connection = Mock()
-        server.connection.send = AsyncMock()
+    async def test_send_to_rust_batches_bursts(self, server, conn):
+        """Test messages queued together go out as one batch frame."""
+        first = utils.build_request("trigger_event", {"n": 1})
+        second = utils.build_request("trigger_event", {"n": 2})
         
-        await server.handle_message("not valid json")
+        server.send_to_rust(first)
+        server.send_to_rust(second)
+        await server._drain_task
         
-        # Should catch and log, probably no response back to client unless implemented?
-        server.connection.send.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_handler_exception(self, server):
-        """Test error raised inside handler."""
-        # Mock VaultBrain to raise generic exception
-        mock_brain = MagicMock()
-        mock_brain.execute_command = AsyncMock(side_effect=ValueError("Handler failed"))
+        assert [json.loads(frame) for frame in conn.sent] == [[first, second]]
         
-        with patch.dict('sys.modules', {'sidecar.vault_brain': MagicMock(VaultBrain=MagicMock(get=MagicMock(return_value=mock_brain)))}):
-            
-            server.connection = Mock()
-            server.connection.send = AsyncMock()
-            server.connection.close = AsyncMock()
-            
-            request = utils.build_request("test.fail", request_id="3")
-            
-            await server.handle_message(json.dumps(request))
-            
-            # Check internal error response
-            server.connection.send.assert_called_once()
-            response_str = server.connection.send.call_args[0][0]
-            response = json.loads(response_str)
-            
-            assert response["error"]["code"] == constants.JSONRPC_INTERNAL_ERROR
-            assert "Handler failed" in response["error"]["message"] or "ValueError" in response["error"]["message"]
+        # A lone message is still sent as a plain object
+        server.send_to_rust(first)
+        await server._drain_task
+        
+        assert json.loads(conn.sent[-1]) == first
 
     @pytest.mark.asyncio
     async def test_handle_connection(self, server, mock_ws):
         """Test that new connection is stored."""
-        
-        async def mock_iter():
-            if False: yield "msg" # Yield nothing
-        
-        mock_ws.__aiter__.side_effect = mock_iter
-        
         await server.handle_connection(mock_ws)
         
         # Should have set connection, then cleared it in finally block
@@ -9,15 +9,27 @@ Includes:
 - ID Generation
 """
 
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import math
 import os
+import stat
 import sys
 import time
 import json
 
 import random
 import string
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from . import constants
 from . import exceptions
 
@@ -25,6 +37,8 @@ from . import exceptions
 # Logging Configuration
 # =============================================================================
 
+# On per-message paths, pass values as loguru args (logger.debug("x: {}", x))
+# rather than f-strings, so nothing is formatted when the level is filtered out.
 from loguru import logger
 
 def configure_logging(
@@ -74,7 +88,9 @@ def configure_logging(
                 retention=5,
                 level=log_level,
                 format=format_str,
-                encoding="utf-8"
+                encoding="utf-8",
+                # Write and rotate on loguru's worker thread, off the event loop
+                enqueue=True,
             )
             
             logger.info(f"Logging to file: {log_file}")
@@ -92,26 +108,27 @@ def configure_logging(
 # JSON-RPC Utilities
 # =============================================================================
 
+_JSONRPC_VERSION = constants.JSONRPC_VERSION
+
+_REQUEST_ID_PREFIX = f"req_{time.time_ns():x}_"
+"""Per-process prefix for generated request ids."""
+
+_next_request_seq = itertools.count().__next__
+
+
 def build_request(
     method: str,
     params: Optional[Dict[str, Any]] = None,
     request_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Build a JSON-RPC 2.0 request message."""
-    message: Dict[str, Any] = {
-        "jsonrpc": constants.JSONRPC_VERSION,
-        "method": method,
-    }
-    
-    if params is not None:
-        message["params"] = params
-    
     if request_id is None:
-        request_id = f"req_{int(time.time() * 1000)}"
+        request_id = _REQUEST_ID_PREFIX + format(_next_request_seq(), "x")
     
-    message["id"] = request_id
+    if params is None:
+        return {"jsonrpc": _JSONRPC_VERSION, "method": method, "id": request_id}
     
-    return message
+    return {"jsonrpc": _JSONRPC_VERSION, "method": method, "params": params, "id": request_id}
 
 
 def build_response(
@@ -120,7 +137,7 @@ def build_response(
 ) -> Dict[str, Any]:
     """Build a JSON-RPC 2.0 success response message."""
     return {
-        "jsonrpc": constants.JSONRPC_VERSION,
+        "jsonrpc": _JSONRPC_VERSION,
         "result": result,
         "id": request_id,
     }
@@ -133,16 +150,13 @@ def build_error(
     request_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Build a JSON-RPC 2.0 error response message."""
-    error_obj = {
-        "code": code,
-        "message": message,
-    }
-    
-    if data is not None:
-        error_obj["data"] = data
+    if data is None:
+        error_obj = {"code": code, "message": message}
+    else:
+        error_obj = {"code": code, "message": message, "data": data}
     
     return {
-        "jsonrpc": constants.JSONRPC_VERSION,
+        "jsonrpc": _JSONRPC_VERSION,
         "error": error_obj,
         "id": request_id,
     }
@@ -172,51 +186,101 @@ def build_method_not_found(
         request_id=request_id,
     )
 
+def has_non_finite(value: Any) -> bool:
+    """Check for NaN/inf floats, which orjson would silently write as null."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(has_non_finite(v) for v in value)
+    return False
+
+def dumps_message(message: Dict[str, Any]) -> str:
+    """Serialize a JSON-RPC message for sending, using orjson when installed.
+
+    NaN/inf go through the stdlib either way, so they encode the same
+    (as NaN/Infinity) whether or not orjson is available.
+    """
+    if ORJSON_AVAILABLE and not has_non_finite(message):
+        try:
+            return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. ints beyond 64 bits, which the stdlib encoder still handles
+            pass
+    return json.dumps(message)
+
+def loads_message(text: str) -> Any:
+    """Parse a received JSON-RPC message, using orjson when installed.
+
+    Raises json.JSONDecodeError on malformed input either way. Note orjson
+    reads integers wider than 64 bits as floats.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # Retry for input only the stdlib accepts (NaN, Infinity)
+            pass
+    return json.loads(text)
+
+_MISSING = object()
+"""Sentinel for absent message fields (distinct from an explicit null)."""
+
+
 def validate_jsonrpc_message(message: Dict[str, Any]) -> None:
     """Validate that a message conforms to JSON-RPC 2.0 spec."""
+    if not isinstance(message, dict):
+        raise exceptions.JSONRPCError("Message must be an object", constants.JSONRPC_INVALID_REQUEST)
+    
     # Check jsonrpc version
-    if "jsonrpc" not in message:
+    version = message.get("jsonrpc", _MISSING)
+    if version is _MISSING:
         raise exceptions.JSONRPCError("Missing 'jsonrpc' field", constants.JSONRPC_INVALID_REQUEST)
     
-    if message["jsonrpc"] != constants.JSONRPC_VERSION:
+    if version != constants.JSONRPC_VERSION:
         raise exceptions.JSONRPCError(
-            f"Invalid JSON-RPC version: {message['jsonrpc']}",
+            f"Invalid JSON-RPC version: {version}",
             constants.JSONRPC_INVALID_REQUEST
         )
     
     # Check if it's a request or response
-    if "method" in message:
+    method = message.get("method", _MISSING)
+    if method is not _MISSING:
         # Request validation
-        if not isinstance(message["method"], str):
+        if not isinstance(method, str):
             raise exceptions.JSONRPCError("Method must be a string", constants.JSONRPC_INVALID_REQUEST)
         
-        if "params" in message and not isinstance(message["params"], (dict, list)):
+        params = message.get("params", _MISSING)
+        if params is not _MISSING and not isinstance(params, (dict, list)):
             raise exceptions.JSONRPCError("Params must be object or array", constants.JSONRPC_INVALID_PARAMS)
+        return
     
-    elif "result" in message or "error" in message:
-        # Response validation
-        if "result" in message and "error" in message:
-            raise exceptions.JSONRPCError(
-                "Response cannot have both 'result' and 'error'",
-                constants.JSONRPC_INVALID_REQUEST
-            )
-        
-        if "error" in message:
-            error = message["error"]
-            if not isinstance(error, dict):
-                raise exceptions.JSONRPCError("Error must be an object", constants.JSONRPC_INVALID_REQUEST)
-            
-            if "code" not in error or "message" not in error:
-                raise exceptions.JSONRPCError(
-                    "Error must have 'code' and 'message'",
-                    constants.JSONRPC_INVALID_REQUEST
-                )
+    has_result = "result" in message
+    error = message.get("error", _MISSING)
     
-    else:
+    if not has_result and error is _MISSING:
         raise exceptions.JSONRPCError(
             "Message must be request or response",
             constants.JSONRPC_INVALID_REQUEST
         )
+    
+    # Response validation
+    if error is not _MISSING:
+        if has_result:
+            raise exceptions.JSONRPCError(
+                "Response cannot have both 'result' and 'error'",
+                constants.JSONRPC_INVALID_REQUEST
+            )
+        
+        if not isinstance(error, dict):
+            raise exceptions.JSONRPCError("Error must be an object", constants.JSONRPC_INVALID_REQUEST)
+        
+        if "code" not in error or "message" not in error:
+            raise exceptions.JSONRPCError(
+                "Error must have 'code' and 'message'",
+                constants.JSONRPC_INVALID_REQUEST
+            )
 
 
 def get_request_id(message: Dict[str, Any]) -> Optional[str]:
@@ -240,21 +304,57 @@ def get_params(message: Dict[str, Any]) -> Dict[str, Any]:
     return params if isinstance(params, dict) else {}
 
 
+def unpack_request(message: Dict[str, Any]) -> Tuple[Optional[str], Optional[str], Dict[str, Any]]:
+    """Extract ``(request_id, method, params)`` from a JSON-RPC message in one pass."""
+    params = message.get("params")
+    if type(params) is not dict:
+        params = {"args": params} if isinstance(params, list) else {}
+    return message.get("id"), message.get("method"), params
+
+
 # =============================================================================
 # Path Utilities
 # =============================================================================
 
+_MISSING_VAULT_CACHE: "OrderedDict[Path, float]" = OrderedDict()
+"""Vault paths recently found missing, mapped to when that result expires."""
+
+_MISSING_VAULT_CACHE_SIZE = 256
+"""Maximum number of missing vault paths remembered."""
+
+_MISSING_VAULT_TTL = 5.0
+"""Seconds a missing vault path is trusted before the filesystem is asked again."""
+
+
+def _forget_missing_vault(*paths: Path) -> None:
+    """Drop paths from the missing-vault cache once they are known to exist."""
+    for path in paths:
+        _MISSING_VAULT_CACHE.pop(path, None)
+
+
 def validate_vault_path(vault_path: Path) -> Path:
     """Validate that a vault directory exists and is accessible."""
+    expires = _MISSING_VAULT_CACHE.get(vault_path)
+    if expires is not None:
+        if time.monotonic() < expires:
+            raise exceptions.VaultNotFoundError(str(vault_path))
+        del _MISSING_VAULT_CACHE[vault_path]
+    
     try:
         resolved_path = vault_path.resolve()
     except Exception as e:
         raise exceptions.InvalidPathError(str(vault_path), f"Cannot resolve path: {e}")
     
-    if not resolved_path.exists():
+    # One stat answers both "exists" and "is a directory"
+    try:
+        mode = os.stat(resolved_path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        _MISSING_VAULT_CACHE[vault_path] = time.monotonic() + _MISSING_VAULT_TTL
+        if len(_MISSING_VAULT_CACHE) > _MISSING_VAULT_CACHE_SIZE:
+            _MISSING_VAULT_CACHE.popitem(last=False)
         raise exceptions.VaultNotFoundError(str(vault_path))
     
-    if not resolved_path.is_dir():
+    if not stat.S_ISDIR(mode):
         raise exceptions.InvalidPathError(str(vault_path), "Path is not a directory")
     
     return resolved_path
@@ -262,26 +362,30 @@ def validate_vault_path(vault_path: Path) -> Path:
 
 def validate_plugin_structure(plugin_dir: Path) -> None:
     """Validate that a plugin directory has the required structure."""
-    if not plugin_dir.exists():
+    try:
+        dir_mode = os.stat(plugin_dir).st_mode
+    except (FileNotFoundError, NotADirectoryError):
         raise exceptions.PluginLoadError(
             plugin_dir.name,
             f"Plugin directory does not exist: {plugin_dir}"
         )
     
-    if not plugin_dir.is_dir():
+    if not stat.S_ISDIR(dir_mode):
         raise exceptions.PluginLoadError(
             plugin_dir.name,
             f"Plugin path is not a directory: {plugin_dir}"
         )
     
     main_file = plugin_dir / constants.PLUGIN_MAIN_FILE
-    if not main_file.exists():
+    try:
+        main_mode = os.stat(main_file).st_mode
+    except FileNotFoundError:
         raise exceptions.PluginLoadError(
             plugin_dir.name,
             f"Plugin missing {constants.PLUGIN_MAIN_FILE}"
         )
     
-    if not main_file.is_file():
+    if not stat.S_ISREG(main_mode):
         raise exceptions.PluginLoadError(
             plugin_dir.name,
             f"{constants.PLUGIN_MAIN_FILE} is not a file"
@@ -297,6 +401,7 @@ def ensure_directory(path: Path, create: bool = True) -> Path:
                 str(path),
                 "Path exists but is not a directory"
             )
+        _forget_missing_vault(path, resolved)
     elif create:
         try:
             resolved.mkdir(parents=True, exist_ok=True)
@@ -305,6 +410,7 @@ def ensure_directory(path: Path, create: bool = True) -> Path:
                 str(path),
                 f"Failed to create directory: {e}"
             )
+        _forget_missing_vault(path, resolved)
     
     return resolved
 
@@ -319,7 +425,76 @@ def get_memory_dir(vault_path: Path, create: bool = True) -> Path:
 def get_plugins_dir(vault_path: Path) -> Optional[Path]:
     """Get the plugins directory for a vault."""
     plugins_path = vault_path / constants.PLUGINS_DIR
-    return plugins_path if plugins_path.exists() and plugins_path.is_dir() else None
+    try:
+        is_dir = stat.S_ISDIR(os.stat(plugins_path).st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return plugins_path if is_dir else None
+
+
+_DISCOVER_CACHE: Dict[Path, Tuple[Tuple[int, int], List[Path]]] = {}
+"""Plugin scan results keyed by plugins directory, tagged with its (inode, mtime_ns)."""
+
+_PARALLEL_DISCOVERY_THRESHOLD = 8
+"""Candidate count above which main.py probes run on a thread pool."""
+
+
+_MAIN_FILE_SUFFIX = os.sep + constants.PLUGIN_MAIN_FILE
+
+
+def _has_main_file(plugin_path: str) -> bool:
+    """Check whether a candidate plugin directory contains a main.py file."""
+    try:
+        return stat.S_ISREG(os.stat(plugin_path + _MAIN_FILE_SUFFIX).st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def discover_plugins(plugins_dir: Path, parallel: Optional[bool] = None) -> List[Path]:
+    """
+    List plugin directories (those containing main.py), sorted by name.
+
+    Hidden (``.``) and private (``_``) entries are skipped. Results are cached
+    until the directory is replaced or its mtime changes; call ``clear_discover_cache()`` after
+    modifying a plugin in place.
+
+    Args:
+        plugins_dir: Directory to scan
+        parallel: Probe candidates on a thread pool, which hides per-stat
+            latency on network mounts. Defaults to doing so above
+            ``_PARALLEL_DISCOVERY_THRESHOLD`` candidates.
+    """
+    st = os.stat(plugins_dir)
+    tag = (st.st_ino, st.st_mtime_ns)
+    cached = _DISCOVER_CACHE.get(plugins_dir)
+    if cached is not None and cached[0] == tag:
+        return list(cached[1])
+
+    # scandir reuses readdir's d_type, so only symlinks and main.py cost a stat
+    with os.scandir(plugins_dir) as entries:
+        candidates = [
+            entry.path for entry in entries
+            if not entry.name.startswith(('.', '_')) and entry.is_dir()
+        ]
+
+    if parallel is None:
+        parallel = len(candidates) > _PARALLEL_DISCOVERY_THRESHOLD
+
+    if parallel and candidates:
+        with ThreadPoolExecutor(max_workers=min(32, len(candidates))) as executor:
+            found = list(executor.map(_has_main_file, candidates))
+    else:
+        found = [_has_main_file(path) for path in candidates]
+
+    plugin_dirs = [Path(path) for path, ok in zip(candidates, found) if ok]
+    plugin_dirs.sort(key=lambda p: p.name)
+    _DISCOVER_CACHE[plugins_dir] = (tag, plugin_dirs)
+    return list(plugin_dirs)
+
+
+def clear_discover_cache() -> None:
+    """Forget all cached ``discover_plugins`` results."""
+    _DISCOVER_CACHE.clear()
 
 # =============================================================================
 # ID Generation / Info Utilities
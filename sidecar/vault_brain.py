@@ -8,10 +8,12 @@ Acts as the central Event/Command hub.
 import asyncio
 import json
 import importlib.util
+import itertools
 import time
 import inspect
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable, Awaitable, List
+from types import ModuleType
+from typing import Dict, Any, Optional, Callable, Awaitable, List, Tuple
 from collections import defaultdict
 
 from . import utils
@@ -37,6 +39,36 @@ CommandHandler = Callable[..., Awaitable[Any]]
 EventHandler = Callable[..., Awaitable[None]]
 
 
+def _overrides_hook(plugin: Any, hook: str) -> bool:
+    """Check whether a plugin replaces one of PluginBase's no-op hooks."""
+    overridden = getattr(type(plugin), "_overridden_hooks", None)
+    # Objects that are not PluginBase subclasses are always called
+    return overridden is None or hook in overridden
+
+
+_PLUGIN_MODULE_CACHE: Dict[str, Tuple[Tuple[int, int], ModuleType]] = {}
+"""Executed plugin modules keyed by main.py path, tagged with its (mtime_ns, size)."""
+
+
+def _load_plugin_module(plugin_name: str, main_file: Path) -> ModuleType:
+    """Execute a plugin's main.py, reusing the module while the file is unchanged."""
+    key = str(main_file)
+    st = main_file.stat()
+    tag = (st.st_mtime_ns, st.st_size)
+    cached = _PLUGIN_MODULE_CACHE.get(key)
+    if cached is not None and cached[0] == tag:
+        return cached[1]
+    
+    spec = importlib.util.spec_from_file_location(plugin_name, main_file)
+    if not spec or not spec.loader:
+        raise exceptions.PluginLoadError(plugin_name, "Failed to create module spec")
+    
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _PLUGIN_MODULE_CACHE[key] = (tag, module)
+    return module
+
+
 class VaultBrain:
     """
     Singleton Orchestrator.
@@ -181,18 +213,29 @@ class VaultBrain:
         logger.info("VaultBrain fully initialized and ready.")
 
     def _register_decorated_handlers(self) -> None:
-        """Scan and register decorated commands and event handlers."""
-        # Scan self for decorated methods
-        for name, method in inspect.getmembers(self, predicate=inspect.ismethod):
+        """Register decorated commands and event handlers."""
+        for name in self._decorated_method_names():
+            method = getattr(self, name)
+            
             # Register Commands
-            if hasattr(method, "_command_meta"):
-                for meta in method._command_meta:
-                    self.register_command(meta["id"], method, meta["plugin"])
+            for meta in getattr(method, "_command_meta", ()):
+                self.register_command(meta["id"], method, meta["plugin"])
             
             # Register Event Handlers
-            if hasattr(method, "_event_meta"):
-                for meta in method._event_meta:
-                    self.subscribe(meta["event"], method)
+            for meta in getattr(method, "_event_meta", ()):
+                self.subscribe(meta["event"], method)
+
+    @classmethod
+    def _decorated_method_names(cls) -> Tuple[str, ...]:
+        """Names of @command/@on_event methods, scanned once per class."""
+        names = cls.__dict__.get("_decorated_names")
+        if names is None:
+            names = tuple(
+                name for name, func in inspect.getmembers(cls, predicate=inspect.isfunction)
+                if hasattr(func, "_command_meta") or hasattr(func, "_event_meta")
+            )
+            cls._decorated_names = names
+        return names
         
     async def shutdown(self) -> None:
         """
@@ -230,18 +273,7 @@ class VaultBrain:
     
         logger.debug(f"Scanning plugins directory: {plugins_dir}")
     
-        plugin_dirs = []
-        for item in plugins_dir.iterdir():
-            if item.is_file():
-                continue
-            if item.name.startswith(('.', '_')):
-                continue
-        
-            main_file = item / constants.PLUGIN_MAIN_FILE
-            if main_file.exists():
-                plugin_dirs.append(item)
-
-        plugin_dirs = sorted(plugin_dirs, key=lambda p: p.name)
+        plugin_dirs = utils.discover_plugins(plugins_dir)
     
         if not plugin_dirs:
             logger.info("No plugins found in vault")
@@ -282,16 +314,9 @@ class VaultBrain:
                 continue
             
             try:
-                utils.validate_plugin_structure(plugin_dir)
-                
-                # Load module
-                main_file = plugin_dir / "main.py"
-                spec = importlib.util.spec_from_file_location(plugin_name, main_file)
-                if not spec or not spec.loader:
-                    raise exceptions.PluginLoadError(plugin_name, "Failed to create module spec")
-                
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
+                # Load module (discover_plugins already vetted main.py; the module
+                # is shared across vaults until main.py changes)
+                module = _load_plugin_module(plugin_name, plugin_dir / "main.py")
                 
                 if not hasattr(module, constants.PLUGIN_CLASS_NAME):
                     raise exceptions.PluginLoadError(plugin_name, f"No '{constants.PLUGIN_CLASS_NAME}' class found")
@@ -325,25 +350,37 @@ class VaultBrain:
         Calls on_load() for all plugins.
         """
         logger.info("Activating plugins (calling on_load)...")
-        for plugin_name, plugin in self.plugins.items():
+        plugins = list(self.plugins.items())
+        
+        # on_load hooks are independent, so a slow plugin doesn't hold up the rest
+        results = await asyncio.gather(
+            *(self._call_on_load(plugin) for _, plugin in plugins),
+            return_exceptions=True,
+        )
+        
+        for (plugin_name, plugin), result in zip(plugins, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                logger.opt(exception=result).error(f"Error activating plugin '{plugin_name}': {result}")
+                continue
+            
             try:
-                await plugin.on_load()
-                
-                # Auto-subscribe to TICK if plugin overrides on_tick
-                # We check if the method is different from the base class implementation
-                # This is a bit tricky since PluginBase is abstract, but we can check if it's callable
-                # A safer way is checking if it's NOT the base implementation, but base is abstract pass?
-                # Actually, PluginBase.on_tick is defined as 'pass'.
-                # Let's just subscribe it. If it does nothing, it does nothing.
-                # Optimization: Check if plugin.on_tick code object is different from PluginBase.on_tick code object?
-                # For now, just subscribe. The event system handles errors.
-                self.subscribe(constants.CoreEvents.TICK, plugin.on_tick)
+                # Auto-subscribe to TICK only if plugin overrides on_tick,
+                # so the default no-op never costs a coroutine per tick
+                if _overrides_hook(plugin, "on_tick"):
+                    self.subscribe(constants.CoreEvents.TICK, plugin.on_tick)
                 
                 # Announce plugin loaded
                 await self.publish(constants.CoreEvents.PLUGIN_LOADED, plugin_name=plugin_name)
             except Exception as e:
                 logger.exception(f"Error activating plugin '{plugin_name}': {e}")
 
+    @staticmethod
+    async def _call_on_load(plugin: Any) -> None:
+        """Await a plugin's on_load, so sync failures surface inside gather."""
+        await plugin.on_load()
+
     # =========================================================================
     # Command Registry
     # =========================================================================
@@ -386,23 +423,18 @@ class VaultBrain:
         """
         Execute a registered command.
         
-        Commands can be registered via:
-        1. brain.register_command() - stored in self.commands
-        2. ws_server.register_handler() - stored in ws_server.command_handlers
-        
-        This method checks both locations for backward compatibility.
+        Commands are registered via brain.register_command() (or the
+        @command decorator) and stored in self.commands.
         """
-        handler = None
+        command_info = self.commands.get(command_id)
         
-        if command_id in self.commands:
-            handler = self.commands[command_id]["handler"]
-        
-        if handler is None:
-            all_commands = list(self.commands.keys())
-            raise exceptions.CommandNotFoundError(command_id, all_commands)
+        if command_info is None:
+            # The error only reports the first few ids, so don't copy the whole registry
+            some_commands = list(itertools.islice(self.commands, constants.MAX_LISTED_COMMANDS))
+            raise exceptions.CommandNotFoundError(command_id, some_commands)
         
         try:
-            result = await handler(**kwargs)
+            result = await command_info["handler"](**kwargs)
             
             # Emit command executed event (fire and forget)
             asyncio.create_task(self.publish(
@@ -422,6 +454,8 @@ class VaultBrain:
         logger.info("Client ready signal received. Triggering plugin hooks...")
         # Trigger on_client_connected for all plugins
         for name, plugin in self.plugins.items():
+            if not _overrides_hook(plugin, "on_client_connected"):
+                continue
             try:
                 await plugin.on_client_connected()
             except Exception as e:
@@ -1063,7 +1097,7 @@ class VaultBrain:
         Send a raw event to the Frontend via WebSocket.
         """
         if not self.is_client_connected:
-            logger.debug(f"Skipping '{event_type}': Client not connected")
+            logger.debug("Skipping '{}': Client not connected", event_type)
             return
 
         # Construct JSON-RPC notification
@@ -7,9 +7,8 @@ manages command/event exchange using JSON-RPC 2.0 protocol.
 
 import asyncio
 import json
-from typing import Optional, Dict, Any, Callable, Awaitable
-import websockets
-from websockets.exceptions import ConnectionClosed
+from collections import deque
+from typing import Optional, Dict, Any, Callable, Awaitable, List, Union
 import inspect
 from loguru import logger
 from . import utils
@@ -48,7 +47,9 @@ class WebSocketServer:
         self.host = host
         self.connection: Optional[Any] = None
         self.message_queue: asyncio.Queue = asyncio.Queue()
-        self.pending_messages: list[Dict[str, Any]] = []
+        self.pending_messages: deque[Dict[str, Any]] = deque(maxlen=constants.WEBSOCKET_MAX_PENDING)
+        self._pending_overflowed = False
+        self._drain_task: Optional[asyncio.Task] = None
         self.brain = None  # Will be set by VaultBrain after initialization
         
         logger.info(f"WebSocket server initialized on {host}:{port}")
@@ -62,19 +63,25 @@ class WebSocketServer:
         """
         logger.info(f"Starting WebSocket server on ws://{self.host}:{self.port}")
         
+        # Imported here so modules that only reference the server skip websockets
+        import websockets
+        
+        # Loopback link: per-message deflate would only burn CPU on both ends
         async with websockets.serve(
             self.handle_connection,
             self.host,
             self.port,
+            compression=None,
+            ping_interval=constants.WEBSOCKET_PING_INTERVAL,
         ):
             logger.info(f"WebSocket server listening on ws://{self.host}:{self.port}")
             
             # Send any pending messages that were queued before server started
             if self.pending_messages and self.connection:
                 logger.debug(f"Sending {len(self.pending_messages)} pending messages")
-                for msg in self.pending_messages:
-                    await self.send(msg)
-                self.pending_messages.clear()
+                while self.pending_messages:
+                    await self.send(self.pending_messages.popleft())
+                self._pending_overflowed = False
             
             # Run forever
             await asyncio.Future()
@@ -86,6 +93,8 @@ class WebSocketServer:
         Args:
             websocket: WebSocket connection instance
         """
+        from websockets.exceptions import ConnectionClosed
+        
         client_addr = websocket.remote_address
         logger.info(f"Client connected from {client_addr}")
         self.connection = websocket
@@ -119,28 +128,43 @@ class WebSocketServer:
         try:
             # Parse JSON
             try:
-                data = json.loads(message)
+                data = utils.loads_message(message)
             except json.JSONDecodeError as e:
                 logger.error(f"Invalid JSON: {message[:100]}")
-                raise exceptions.WebSocketMessageError(message, f"JSON parse error: {e}")
+                # The id is unknowable here, so the spec answers with id null
+                await self.send(utils.build_error(
+                    constants.JSONRPC_PARSE_ERROR, f"JSON parse error: {e}"
+                ))
+                return
             
             # Validate JSON-RPC structure
             try:
                 utils.validate_jsonrpc_message(data)
             except exceptions.JSONRPCError as e:
                 logger.error(f"Invalid JSON-RPC message: {e.message}")
-                raise
+                # Reply at once; id is null when the message carried no usable one
+                rejected_id = data.get("id") if isinstance(data, dict) else None
+                await self.send(utils.build_error(e.code, e.message, request_id=rejected_id))
+                return
             
             # Extract message components
-            request_id = utils.get_request_id(data)
-            method = utils.get_method(data)
-            params = utils.get_params(data)
+            request_id, method, params = utils.unpack_request(data)
             
             if not method:
+                # Responses carry no method and must never be answered
+                if "result" in data or "error" in data:
+                    logger.debug("Ignoring JSON-RPC response: {}", request_id)
+                    return
                 logger.error(f"Message missing method: {data}")
+                if request_id is not None:
+                    await self.send(utils.build_error(
+                        constants.JSONRPC_INVALID_REQUEST,
+                        "Message missing method",
+                        request_id=request_id,
+                    ))
                 return
             
-            logger.debug(f"Received command: {method}")
+            logger.debug("Received command: {}", method)
             
             try:
                 result = await self._execute_request(method, params, request_id)
@@ -148,7 +172,7 @@ class WebSocketServer:
                 # Send success response
                 response = utils.build_response(result, request_id=request_id)
                 await self.send(response)
-                logger.debug(f"Command '{method}' executed successfully")
+                logger.debug("Command '{}' executed successfully", method)
                 
             except exceptions.MethodNotFoundError:
                 logger.warning(f"No handler registered for method: {method}")
@@ -194,17 +218,20 @@ class WebSocketServer:
         except exceptions.CommandNotFoundError:
             raise exceptions.MethodNotFoundError(method)
             
-    async def send(self, data: Dict[str, Any]) -> None:
+    async def send(self, data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> None:
         """
         Send message to Rust.
         
         Args:
-            data: Message data (will be JSON encoded)
+            data: Message data, or a JSON-RPC batch list (will be JSON encoded)
         """
         if self.is_connected():
             try:
-                await self.connection.send(json.dumps(data))
-                logger.debug(f"Sent message: {data.get('method', 'response')}")
+                await self.connection.send(utils.dumps_message(data))
+                if isinstance(data, list):
+                    logger.debug("Sent batch of {} messages", len(data))
+                else:
+                    logger.debug("Sent message: {}", data.get("method", "response"))
             except Exception as e:
                 logger.exception(f"Send error: {e}")
                 self.close()
@@ -238,14 +265,30 @@ class WebSocketServer:
         Args:
             data: Dictionary to send as JSON-RPC message
         """
-        # Try to create task if event loop is running
         try:
-            loop = asyncio.get_running_loop()
-            asyncio.create_task(self.send(data))
+            asyncio.get_running_loop()
         except RuntimeError:
             # No running loop yet - queue message to send when connected
-            logger.debug(f"Queuing message (no event loop): {data.get('method', 'unknown')}")
+            logger.debug("Queuing message (no event loop): {}", data.get("method", "unknown"))
+            if len(self.pending_messages) == self.pending_messages.maxlen and not self._pending_overflowed:
+                logger.warning("Pending message buffer full, dropping oldest messages")
+                self._pending_overflowed = True
             self.pending_messages.append(data)
+            return
+        
+        # One drain task per burst: messages queued before it runs share a frame
+        self.message_queue.put_nowait(data)
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain_message_queue())
+    
+    async def _drain_message_queue(self) -> None:
+        """Send queued messages, coalescing whatever is waiting into batch frames."""
+        while not self.message_queue.empty():
+            batch = [self.message_queue.get_nowait()]
+            while len(batch) < constants.WEBSOCKET_MAX_BATCH and not self.message_queue.empty():
+                batch.append(self.message_queue.get_nowait())
+            
+            await self.send(batch[0] if len(batch) == 1 else batch)
     
     def is_connected(self) -> bool:
         """
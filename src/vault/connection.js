@@ -71,11 +71,14 @@ export function connect(explicitPort, loadPluginsFn, handleEventFn) {
     ws.onmessage = (e) => {
         try {
             const data = JSON.parse(e.data);
-            if (data.method === 'trigger_event') {
-                if (handleEventFn) handleEventFn(data.params);
-            } else if (data.id && pending.has(data.id)) {
-                pending.get(data.id)(data);
-                pending.delete(data.id);
+            // The sidecar coalesces bursts of messages into a JSON-RPC batch array
+            for (const msg of Array.isArray(data) ? data : [data]) {
+                if (msg.method === 'trigger_event') {
+                    if (handleEventFn) handleEventFn(msg.params);
+                } else if (msg.id && pending.has(msg.id)) {
+                    pending.get(msg.id)(msg);
+                    pending.delete(msg.id);
+                }
             }
         } catch (err) {
             log(`Parse Error: ${err}`, 'error');